@@ -1,6 +1,8 @@
+import asyncio
 import logging
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
+import discord
 from redbot.core import Config
 from redbot.core.bot import Red
 
@@ -13,36 +15,83 @@ log = logging.getLogger("red.interactions.state")
 
 
 class InteractionState:
-    __slots__ = ("bot", "application_id", "http", "command_cache", "config")
+    __slots__ = (
+        "bot",
+        "application_id",
+        "http",
+        "_commands_snapshot",
+        "get_command",
+        "config",
+        "_handlers",
+        "_discord_state",
+    )
 
     def __init__(self, bot: Red, application_id: int, config: Config):
         self.bot = bot
+        self._discord_state: discord.state.AutoShardedConnectionState = bot._connection
         self.application_id = application_id
         self.http = InteractionsHTTPClient(self)
-        self.command_cache: Dict[int, SlashCommand] = {}
+        # the cache is never mutated in place, writers build a new dict and swap it in so
+        # readers always see a consistent snapshot. keys are always int snowflakes, both
+        # from SlashCommand.from_dict and from the command ID of incoming interactions
+        self._commands_snapshot: Dict[int, SlashCommand] = {}
+        self.get_command: Callable[[int], Optional[SlashCommand]] = self._commands_snapshot.get
         self.config = config
+        # indexed by interaction type, 2 is APPLICATION_COMMAND and 3 is MESSAGE_COMPONENT
+        self._handlers = (
+            None,
+            None,
+            self.handle_slash_interaction,
+            self.handle_button_interaction,
+        )
 
-        bot._connection.parsers["INTERACTION_CREATE"] = self.parse_interaction_create
+        self._discord_state.parsers["INTERACTION_CREATE"] = self.parse_interaction_create
 
     def __repr__(self):
         return f"<{type(self).__name__} application_id={self.application_id} command_count={len(self.command_cache)}>"
 
     async def cache_commands(self):
         commands = await self.config.commands()
-        for command_data in commands.values():
-            command = SlashCommand.from_dict(self, command_data)
-            command.add_to_cache()
+        # deserializing is pure CPU work, run it off the event loop so startup with many
+        # commands doesn't hold up the gateway
+        built = await asyncio.get_running_loop().run_in_executor(
+            None, lambda: [SlashCommand.from_dict(self, data) for data in commands.values()]
+        )
+        snapshot = self._commands_snapshot.copy()
+        snapshot.update((command.id, command) for command in built)
+        self._swap_commands(snapshot)
 
-    def get_command(self, command_id: int, /) -> Optional[SlashCommand]:
-        return self.command_cache.get(command_id)
+    @property
+    def command_cache(self) -> Dict[int, SlashCommand]:
+        return self._commands_snapshot
+
+    def _swap_commands(self, commands: Dict[int, SlashCommand]):
+        self._commands_snapshot = commands
+        self.get_command = commands.get
+
+    def _cache_command(self, command: SlashCommand):
+        commands = self._commands_snapshot.copy()
+        commands[command.id] = command
+        self._swap_commands(commands)
+
+    def _uncache_command(self, command_id: int):
+        if command_id in self._commands_snapshot:
+            commands = self._commands_snapshot.copy()
+            del commands[command_id]
+            self._swap_commands(commands)
 
     async def teardown(self):
-        del self.bot._connection.parsers["INTERACTION_CREATE"]
+        del self._discord_state.parsers["INTERACTION_CREATE"]
 
     def parse_interaction_create(self, data: dict):
-        log.debug("Interaction data received:\n%r", data)
-        handlers = {2: self.handle_slash_interaction, 3: self.handle_button_interaction}
-        handler = handlers.get(data["type"], self.handle_slash_interaction)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Interaction data received:\n%r", data)
+        interaction_type = data["type"]
+        handlers = self._handlers
+        if interaction_type < len(handlers) and handlers[interaction_type]:
+            handler = handlers[interaction_type]
+        else:
+            handler = self.handle_slash_interaction
         try:
             handler(data)
         except Exception as e:
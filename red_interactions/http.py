@@ -1,9 +1,16 @@
 import logging
 from typing import List
+from urllib.parse import quote as _uriquote
 
+import aiohttp
 import discord
 from redbot.core.bot import Red
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 log = logging.getLogger("red.interactions.http")
 
 __all__ = ("InteractionsHTTPClient",)
@@ -13,100 +20,123 @@ class Route(discord.http.Route):
     BASE = "https://discord.com/api/v8"
 
 
+class _FastRoute(Route):
+    # Route formats its path with **parameters on every request, this takes a path that
+    # was already formatted instead. The bucket is still keyed on the unformatted path
+    # so requests are rate limited together the same way a Route would be.
+    bucket = None
+
+    def __init__(self, method: str, path: str, bucket_path: str, *, guild_id: int = None):
+        self.method = method
+        self.path = bucket_path
+        self.url = self.BASE + path
+        self.channel_id = None
+        self.guild_id = guild_id
+        self.bucket = f"None:{guild_id}:{bucket_path}"
+
+
 class InteractionsHTTPClient:
-    __slots__ = ("state", "bot", "request")
+    __slots__ = (
+        "state",
+        "bot",
+        "request",
+        "_route_add_cmd",
+        "_route_get_cmds",
+        "_route_put_cmds",
+        "_edit_cmd_tmpl",
+        "_guild_cmds_tmpl",
+        "_guild_cmd_tmpl",
+        "_webhook_url",
+        "_cached_am_obj",
+        "_cached_am_dict",
+    )
+
+    _CALLBACK_BUCKET = "/interactions/{interaction_id}/{token}/callback"
+    _WEBHOOK_BUCKET = "/webhooks/{application_id}/{token}"
+    _WEBHOOK_MESSAGE_BUCKET = "/webhooks/{application_id}/{token}/messages/{message_id}"
+    _WEBHOOK_ORIGINAL_BUCKET = "/webhooks/{application_id}/{token}/messages/@original"
 
     def __init__(self, state: "InteractionState"):
         self.state = state
         self.bot = state.bot
         self.request = state.bot.http.request
 
+        # the application ID never changes after init, so format it into the URLs once
+        application_id = self.application_id
+        base_cmds_url = f"/applications/{application_id}/commands"
+        self._route_add_cmd = _FastRoute("POST", base_cmds_url, base_cmds_url)
+        self._route_get_cmds = _FastRoute("GET", base_cmds_url, base_cmds_url)
+        self._route_put_cmds = _FastRoute("PUT", base_cmds_url, base_cmds_url)
+        self._edit_cmd_tmpl = base_cmds_url + "/{command_id}"
+        self._guild_cmds_tmpl = f"/applications/{application_id}/guilds/{{guild_id}}/commands"
+        self._guild_cmd_tmpl = self._guild_cmds_tmpl + "/{command_id}"
+        self._webhook_url = f"/webhooks/{application_id}"
+
+        self._cached_am_obj = None
+        self._cached_am_dict = None
+
     @property
     def application_id(self) -> int:
         return self.state.application_id
 
+    def _json_request(self, route: Route, payload):
+        if orjson is None:
+            return self.request(route, json=payload)
+        # discord.py replaces any headers passed to request, so the content type is
+        # carried by the payload object instead
+        data = aiohttp.BytesPayload(orjson.dumps(payload), content_type="application/json")
+        return self.request(route, data=data)
+
+    def _am_dict(self, allowed_mentions: discord.AllowedMentions) -> dict:
+        # the same AllowedMentions (usually the bot's default) is passed on nearly every call
+        if allowed_mentions is not self._cached_am_obj:
+            self._cached_am_obj = allowed_mentions
+            self._cached_am_dict = allowed_mentions.to_dict()
+        return self._cached_am_dict
+
     def add_slash_command(self, command: dict):
-        route = Route(
-            "POST", "/applications/{application_id}/commands", application_id=self.application_id
-        )
-        return self.request(route, json=command)
+        return self._json_request(self._route_add_cmd, command)
 
     def edit_slash_command(self, command_id: int, command: dict):
-        route = Route(
-            "PATCH",
-            "/applications/{application_id}/commands/{command_id}",
-            application_id=self.application_id,
-            command_id=command_id,
-        )
-        return self.request(route, json=command)
+        path = self._edit_cmd_tmpl.format(command_id=command_id)
+        route = _FastRoute("PATCH", path, self._edit_cmd_tmpl)
+        return self._json_request(route, command)
 
     def remove_slash_command(self, command_id: int):
-        route = Route(
-            "DELETE",
-            "/applications/{application_id}/commands/{command_id}",
-            application_id=self.application_id,
-            command_id=command_id,
-        )
+        path = self._edit_cmd_tmpl.format(command_id=command_id)
+        route = _FastRoute("DELETE", path, self._edit_cmd_tmpl)
         return self.request(route)
 
     def get_slash_commands(self):
-        route = Route(
-            "GET", "/applications/{application_id}/commands", application_id=self.application_id
-        )
-        return self.request(route)
+        return self.request(self._route_get_cmds)
 
     def put_slash_commands(self, commands: list):
-        route = Route(
-            "PUT", "/applications/{application_id}/commands", application_id=self.application_id
-        )
-        return self.request(route, json=commands)
+        return self._json_request(self._route_put_cmds, commands)
 
     def add_guild_slash_command(self, guild_id: int, command: dict):
-        route = Route(
-            "POST",
-            "/applications/{application_id}/guilds/{guild_id}/commands",
-            application_id=self.application_id,
-            guild_id=guild_id,
-        )
-        return self.request(route, json=command)
+        path = self._guild_cmds_tmpl.format(guild_id=guild_id)
+        route = _FastRoute("POST", path, self._guild_cmds_tmpl, guild_id=guild_id)
+        return self._json_request(route, command)
 
     def edit_guild_slash_command(self, guild_id: int, command_id: int, command: dict):
-        route = Route(
-            "PATCH",
-            "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
-            application_id=self.application_id,
-            guild_id=guild_id,
-            command_id=command_id,
-        )
-        return self.request(route, json=command)
+        path = self._guild_cmd_tmpl.format(guild_id=guild_id, command_id=command_id)
+        route = _FastRoute("PATCH", path, self._guild_cmd_tmpl, guild_id=guild_id)
+        return self._json_request(route, command)
 
     def remove_guild_slash_command(self, guild_id: int, command_id: int):
-        route = Route(
-            "DELETE",
-            "/applications/{application_id}/guilds/{guild_id}/commands/{command_id}",
-            application_id=self.application_id,
-            guild_id=guild_id,
-            command_id=command_id,
-        )
+        path = self._guild_cmd_tmpl.format(guild_id=guild_id, command_id=command_id)
+        route = _FastRoute("DELETE", path, self._guild_cmd_tmpl, guild_id=guild_id)
         return self.request(route)
 
     def get_guild_slash_commands(self, guild_id: int):
-        route = Route(
-            "GET",
-            "/applications/{application_id}/guilds/{guild_id}/commands",
-            application_id=self.application_id,
-            guild_id=guild_id,
-        )
+        path = self._guild_cmds_tmpl.format(guild_id=guild_id)
+        route = _FastRoute("GET", path, self._guild_cmds_tmpl, guild_id=guild_id)
         return self.request(route)
 
     def put_guild_slash_commands(self, guild_id: int, commands: list):
-        route = Route(
-            "PUT",
-            "/applications/{application_id}/guilds/{guild_id}/commands",
-            application_id=self.application_id,
-            guild_id=guild_id,
-        )
-        return self.request(route, json=commands)
+        path = self._guild_cmds_tmpl.format(guild_id=guild_id)
+        route = _FastRoute("PUT", path, self._guild_cmds_tmpl, guild_id=guild_id)
+        return self._json_request(route, commands)
 
     def send_message(
         self,
@@ -123,7 +153,7 @@ class InteractionsHTTPClient:
         flags: int = None,
         components: list = None,
     ):
-        payload = {"type": type.value}
+        payload = {"type": type}
 
         if embed is not None:
             embeds = [embed]
@@ -137,41 +167,29 @@ class InteractionsHTTPClient:
             data["tts"] = True
         if embeds:
             data["embeds"] = [e.to_dict() for e in embeds]
-        if allowed_mentions:
-            data[
-                "allowed_mentions"
-            ] = (
-                allowed_mentions.to_dict()
-            )  # its 1:30 am but i should check later whether this is necessary
-        if flags:
-            data["flags"] = flags
-        if embeds:
-            data["embeds"] = [e.to_dict() for e in embeds]
         if flags:
             data["flags"] = flags
         if components is not None:
             data["components"] = [c.to_dict() for c in components]
 
         if data:
-            data["allowed_mentions"] = allowed_mentions.to_dict()
+            if allowed_mentions is not None:
+                data["allowed_mentions"] = self._am_dict(allowed_mentions)
             payload["data"] = data
 
+        token = _uriquote(token)
         if initial_response:
-            url = "/interactions/{interaction_id}/{token}/callback"
+            path = f"/interactions/{interaction_id}/{token}/callback"
+            route = _FastRoute("POST", path, self._CALLBACK_BUCKET)
             send_data = payload
         else:
-            url = "/webhooks/{application_id}/{token}"
+            path = f"{self._webhook_url}/{token}"
+            route = _FastRoute("POST", path, self._WEBHOOK_BUCKET)
             send_data = data
-        route = Route(
-            "POST",
-            url,
-            interaction_id=interaction_id,
-            token=token,
-            application_id=self.application_id,
-        )
 
-        log.debug("sending response, initial = %r: %r" % (initial_response, send_data))
-        return self.request(route, json=send_data)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("sending response, initial = %r: %r", initial_response, send_data)
+        return self._json_request(route, send_data)
 
     def edit_message(
         self,
@@ -185,15 +203,11 @@ class InteractionsHTTPClient:
         original: bool = False,
         components: list = None,
     ):
-        url = "/webhooks/{application_id}/{token}/messages/"
-        url += "@original" if original else "{message_id}"
-        route = Route(
-            "PATCH",
-            url,
-            application_id=self.application_id,
-            token=token,
-            message_id=message_id,
-        )
+        path = f"{self._webhook_url}/{_uriquote(token)}/messages/"
+        if original:
+            route = _FastRoute("PATCH", path + "@original", self._WEBHOOK_ORIGINAL_BUCKET)
+        else:
+            route = _FastRoute("PATCH", f"{path}{message_id}", self._WEBHOOK_MESSAGE_BUCKET)
         if embed is not None:
             embeds = [embed]
         if allowed_mentions is None:
@@ -207,16 +221,11 @@ class InteractionsHTTPClient:
         if components is not None:
             payload["components"] = [c.to_dict() for c in components]
 
-        payload["allowed_mentions"] = allowed_mentions.to_dict()
+        payload["allowed_mentions"] = self._am_dict(allowed_mentions)
 
-        return self.request(route, json=payload)
+        return self._json_request(route, payload)
 
     def delete_message(self, token: str, message_id: str):
-        route = Route(
-            "DELETE",
-            "/webhooks/{application_id}/{token}/messages/{message_id}",
-            application_id=self.application_id,
-            token=token,
-            message_id=message_id,
-        )
+        path = f"{self._webhook_url}/{_uriquote(token)}/messages/{message_id}"
+        route = _FastRoute("DELETE", path, self._WEBHOOK_MESSAGE_BUCKET)
         return self.request(route)
@@ -1,10 +1,11 @@
 import logging
+import operator
 from enum import IntEnum
 from typing import Any, Iterator, List, Tuple, Union
 
 import discord
 
-from .interactions import InteractionCallbackType, InteractionResponse
+from .interactions import _EPHEMERAL_FLAG, InteractionCallbackType, InteractionResponse
 
 __all__ = (
     "ButtonStyle",
@@ -24,6 +25,10 @@ class ButtonStyle(IntEnum):
     link = 5
 
 
+_BUTTON_STYLES = {style.value: style for style in ButtonStyle}
+_EMPTY = ()
+
+
 class Component:
     __slots__ = ("type", "components", "style", "label", "custom_id", "url", "emoji", "disabled")
 
@@ -31,7 +36,7 @@ class Component:
         self,
         type: int = 1,
         *,
-        components: List["Component"] = [],
+        components: List["Component"] = None,
         style: ButtonStyle = None,
         label: str = None,
         custom_id: int = None,
@@ -40,7 +45,11 @@ class Component:
         disabled: bool = False,
     ):
         self.type = type
-        self.components = components.copy()
+        if components:
+            self.components = list(components)
+        else:
+            # only action rows hold components, buttons share one empty tuple
+            self.components = [] if type == 1 else _EMPTY
         self.style = style
         self.label = label
         self.custom_id = str(custom_id) if custom_id else None
@@ -51,39 +60,50 @@ class Component:
         self.disabled = disabled
 
     def __repr__(self):
-        kwargs = " ".join(
-            f"{k}={v!r}" for k, v in self.get_slotted_items() if v and not k.startswith("_")
-        )
+        kwargs = " ".join(f"{k}={v!r}" for k, getter in _SLOT_GETTERS if (v := getter(self)))
         return f"<{type(self).__name__} {kwargs}>"
 
     def to_dict(self):
-        data = {"type": self.type}
         if self.type == 1:
-            data["components"] = [c.to_dict() for c in self.components]
-        else:  # elif type == 2:
-            data["style"] = self.style.value
-            if self.label:
-                data["label"] = self.label
-            if self.custom_id:
-                data["custom_id"] = self.custom_id
-            if self.url:
-                data["url"] = self.url
-            if self.emoji:
-                data["emoji"] = self.emoji.to_dict()
-            if self.disabled:
-                data["disabled"] = self.disabled
+            return {"type": 1, "components": [c.to_dict() for c in self.components]}
+        data = {"type": self.type, "style": self.style.value}
+        if self.label:
+            data["label"] = self.label
+        if self.custom_id:
+            data["custom_id"] = self.custom_id
+        if self.url:
+            data["url"] = self.url
+        if self.emoji:
+            data["emoji"] = self.emoji.to_dict()
+        if self.disabled:
+            data["disabled"] = self.disabled
         return data
 
     @classmethod
     def from_dict(cls, data: dict):
-        type = data.pop["type"]
-        components = [cls.from_dict(c) for c in data.get("components", [])]
-        style = ButtonStyle(data.get("style"), 1)
-        label = data.get("label")
-        custom_id = data.get("custom_id")
-        url = data.get("url")
+        root = cls._from_dict_shallow(data)
+        # walk the tree with a stack rather than recursing once per child
+        stack = [(root, data)]
+        while stack:
+            component, component_data = stack.pop()
+            if children_data := component_data.get("components"):
+                children = [cls._from_dict_shallow(c) for c in children_data]
+                component.components = children
+                stack.extend(zip(children, children_data))
+        return root
+
+    @classmethod
+    def _from_dict_shallow(cls, data: dict):
+        style = data.get("style")
+        emoji = data.get("emoji")
         return cls(
-            type, components=components, style=style, label=label, custom_id=custom_id, url=url
+            data["type"],
+            style=_BUTTON_STYLES.get(style, style),
+            label=data.get("label"),
+            custom_id=data.get("custom_id"),
+            url=data.get("url"),
+            emoji=discord.PartialEmoji.from_dict(emoji) if emoji else None,
+            disabled=data.get("disabled", False),
         )
 
     def get_slotted_items(self) -> Iterator[Tuple[str, Any]]:
@@ -91,6 +111,11 @@ class Component:
             yield slot, getattr(self, slot)
 
 
+_SLOT_GETTERS = tuple(
+    (slot, operator.attrgetter(slot)) for slot in Component.__slots__ if not slot.startswith("_")
+)
+
+
 class Button(Component):
     def __init__(self, **kwargs):
         super().__init__(2, **kwargs)
@@ -114,14 +139,14 @@ class InteractionButton(InteractionResponse):
 
         try:
             self.message = discord.Message(
-                channel=self.channel, data=message, state=self._discord_state
+                channel=self.channel, data=message, state=self.state._discord_state
             )
         except Exception as exc:
             log.exception("An error occured while creating the message for %r", self, exc_info=exc)
             self.message = None
 
     async def defer_update(self, *, hidden: bool = False):
-        flags = 64 if hidden else None
+        flags = _EPHEMERAL_FLAG if hidden else None
         initial = not self.sent
         data = await self.http.send_message(
             self._token,
@@ -130,8 +155,7 @@ class InteractionButton(InteractionResponse):
             initial_response=initial,
             flags=flags,
         )
-        if not self.sent:
-            self.sent = True
+        self.sent = True
         self.deferred = True
         return data
 
@@ -147,7 +171,7 @@ class InteractionButton(InteractionResponse):
         delete_after: int = None,
         components: List[Component] = None,
     ):
-        flags = 64 if hidden else None
+        flags = _EPHEMERAL_FLAG if hidden else None
         initial = not self.sent
         if initial:
             data = await self.http.send_message(
@@ -175,5 +199,4 @@ class InteractionButton(InteractionResponse):
                 original=True,
             )
 
-        if not self.completed:
-            self.completed = True
+        self.completed = True
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from enum import IntEnum
-from typing import List, Union
+from typing import List, Optional, Union
 
 import discord
 from redbot.core.bot import Red
@@ -16,6 +16,14 @@ __all__ = (
     "InteractionResponse",
 )
 
+_EPHEMERAL_FLAG = 64
+
+
+def _get_as_snowflake(data: dict, key: str, _int=int) -> Optional[int]:
+    # local version of discord.utils._get_as_snowflake without the module attribute lookups
+    value = data.get(key)
+    return _int(value) if value is not None else None
+
 
 class InteractionCallbackType(IntEnum):
     pong = 1
@@ -78,9 +86,7 @@ class InteractionMessage(discord.Message):
 class InteractionResponse:
     __slots__ = (
         "state",
-        "bot",
         "http",
-        "_discord_state",
         "id",
         "version",
         "_token",
@@ -90,38 +96,38 @@ class InteractionResponse:
         "_channel",
         "application_id",
         "author_id",
-        "author",
+        "_member_data",
+        "_cs_author",
+        "_cs_guild",
         "interaction_data",
         "sent",
         "deferred",
         "completed",
     )
 
+    # set to True to keep the raw gateway payload on _original_data for debugging
+    keep_original_data = False
+
     def __init__(self, *, state: "InteractionState", data: dict):
         self.state = state
-        self.bot = state.bot
         self.http = state.http
-        self._discord_state: discord.state.AutoShardedConnectionState = self.bot._connection
         self.id = int(data["id"])
         self.version = data["version"]
         self._token = data["token"]
-        self._original_data = data
+        self._original_data = data if self.keep_original_data else None
 
-        self.guild_id = guild_id = discord.utils._get_as_snowflake(data, "guild_id")
-        self.channel_id = discord.utils._get_as_snowflake(data, "channel_id")
+        self.guild_id = guild_id = _get_as_snowflake(data, "guild_id")
+        self.channel_id = _get_as_snowflake(data, "channel_id")
         self._channel = None
-        self.application_id = discord.utils._get_as_snowflake(data, "application_id")
+        self.application_id = _get_as_snowflake(data, "application_id")
 
         if guild_id:
             member_data = data["member"]
             self.author_id = int(member_data["user"]["id"])
-            self.author = discord.Member(
-                data=member_data, state=self._discord_state, guild=self.guild
-            )
         else:
             member_data = data["user"]
             self.author_id = int(member_data["id"])
-            self.author = discord.User(data=member_data, state=self._discord_state)
+        self._member_data = member_data
 
         self.interaction_data = data["data"]
         self.sent = False
@@ -134,20 +140,33 @@ class InteractionResponse:
         )
 
     @property
+    def bot(self) -> Red:
+        return self.state.bot
+
+    @discord.utils.cached_slot_property("_cs_guild")
     def guild(self) -> discord.Guild:
         return self.bot.get_guild(self.guild_id)
 
+    @discord.utils.cached_slot_property("_cs_author")
+    def author(self) -> Union[discord.Member, discord.User]:
+        if self.guild_id:
+            return discord.Member(
+                data=self._member_data, state=self.state._discord_state, guild=self.guild
+            )
+        return discord.User(data=self._member_data, state=self.state._discord_state)
+
     @property
     def channel(self) -> discord.TextChannel:
         if channel := self._channel:
             return channel
-        elif self.guild_id:
-            if guild_channel := self.guild.get_channel(self.channel_id):
-                self._channel = channel
-                return guild_channel
-        elif dm_channel := self.bot.get_channel(self.channel_id):
-            self._channel = dm_channel
-            return dm_channel
+        if self.guild_id:
+            guild = self.guild
+            channel = guild.get_channel(self.channel_id) if guild else None
+        else:
+            channel = self.bot.get_channel(self.channel_id)
+        if channel:
+            self._channel = channel
+        return channel
 
     async def get_channel(self) -> Union[discord.TextChannel, discord.DMChannel]:
         if channel := self.channel:
@@ -175,7 +194,7 @@ class InteractionResponse:
         reference=None,  # this parameter and the one below are unused
         mention_author=None,  # they exist to prevent replies from erroring
     ):
-        flags = 64 if hidden else None
+        flags = _EPHEMERAL_FLAG if hidden else None
         initial = not self.sent
         data = await self.http.send_message(
             self._token,
@@ -190,10 +209,8 @@ class InteractionResponse:
             flags=flags,
         )
 
-        if initial:
-            self.sent = True
-        if not self.completed:
-            self.completed = True
+        self.sent = True
+        self.completed = True
 
         if data:
             try:
@@ -201,7 +218,7 @@ class InteractionResponse:
                     self,
                     data=data,
                     channel=self.channel,
-                    state=self._discord_state,
+                    state=self.state._discord_state,
                 )
             except Exception as e:
                 log.exception("Failed to create message object for data:\n%r", data, exc_info=e)
@@ -212,8 +229,26 @@ class InteractionResponse:
 
     reply = send
 
+    async def send_many(self, payloads: List[dict]) -> List[Optional[InteractionMessage]]:
+        """
+        Send multiple messages in response to this interaction.
+
+        Each payload is a dict of keyword arguments for :meth:`send`. If the interaction
+        hasn't been responded to yet, the first payload is sent as the initial response
+        and the rest are sent as follow-ups once it completes. Follow-ups are sent
+        concurrently, so Discord may not display them in the order given.
+        """
+        messages = []
+        if not payloads:
+            return messages
+        if not self.sent:
+            messages.append(await self.send(**payloads[0]))
+            payloads = payloads[1:]
+        messages.extend(await asyncio.gather(*(self.send(**payload) for payload in payloads)))
+        return messages
+
     async def defer(self, *, hidden: bool = False):
-        flags = 64 if hidden else None
+        flags = _EPHEMERAL_FLAG if hidden else None
         initial = not self.sent
         data = await self.http.send_message(
             self._token,
@@ -222,7 +257,6 @@ class InteractionResponse:
             initial_response=initial,
             flags=flags,
         )
-        if not self.sent:
-            self.sent = True
+        self.sent = True
         self.deferred = True
         return data
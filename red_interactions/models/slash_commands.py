@@ -1,6 +1,6 @@
 import logging
 from enum import IntEnum
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import discord
 
@@ -18,6 +18,12 @@ __all__ = (
 
 log = logging.getLogger("red.interactions.models.slash_commands")
 
+# default for option payloads that are only iterated, model attributes stay real lists
+_EMPTY = ()
+
+_UNKNOWN_CACHE_SIZE = 128
+_UNKNOWN_CACHE: Dict[int, "UnknownCommand"] = {}
+
 
 class UnknownCommand:
     __slots__ = ("id",)
@@ -26,6 +32,21 @@ class UnknownCommand:
     def __init__(self, *, id: int = None):
         self.id = id
 
+    @classmethod
+    def get(cls, id: int) -> "UnknownCommand":
+        """
+        Return a shared UnknownCommand for the given ID.
+        """
+        try:
+            return _UNKNOWN_CACHE[id]
+        except KeyError:
+            pass
+        if len(_UNKNOWN_CACHE) >= _UNKNOWN_CACHE_SIZE:
+            # drop the oldest entry, dicts keep insertion order
+            del _UNKNOWN_CACHE[next(iter(_UNKNOWN_CACHE))]
+        command = _UNKNOWN_CACHE[id] = cls(id=id)
+        return command
+
     def __repr__(self) -> str:
         return f"UnknownCommand(id={self.id})"
 
@@ -73,14 +94,26 @@ class SlashOptionType(IntEnum):
     ROLE = 8
 
 
+# indexed by option type value, avoids the enum's value lookup when parsing trusted data.
+# values missing from the enum are None and fall back to SlashOptionType(...)
+_OPTION_TYPES = tuple(
+    SlashOptionType._value2member_map_.get(value) for value in range(max(SlashOptionType) + 1)
+)
+
+
 class ResponseOption:
-    __slots__ = ("type", "name", "value")
+    __slots__ = ("_type_value", "name", "value")
 
-    def __init__(self, *, type: SlashOptionType, name: str, value: str):
-        self.type = type
+    def __init__(self, *, type: int, name: str, value: str):
+        # kept as a plain int, the enum is only built when .type is accessed
+        self._type_value = int(type)
         self.name = name
         self.value = value
 
+    @property
+    def type(self) -> SlashOptionType:
+        return SlashOptionType(self._type_value)
+
     def set_value(self, value):
         self.value = value
 
@@ -89,19 +122,29 @@ class ResponseOption:
 
     @classmethod
     def from_dict(cls, data: dict):
-        type = SlashOptionType(data.get("type", 3))
-        return cls(type=type, name=data["name"], value=data["value"])
+        return cls(type=data.get("type", 3), name=data["name"], value=data["value"])
 
 
 class SlashOptionChoice:
-    __slots__ = ("name", "value")
+    __slots__ = ("name", "value", "_cached")
 
     def __init__(self, name: str, value: Union[str, int]):
         self.name = name
         self.value = value
+        self._cached = None
+
+    def invalidate(self):
+        """
+        Clear the cached payload returned by :meth:`to_dict`.
+
+        This must be called after modifying the choice, since the payload is only built once.
+        """
+        self._cached = None
 
     def to_dict(self):
-        return {"name": self.name, "value": self.value}
+        if (data := self._cached) is None:
+            data = self._cached = {"name": self.name, "value": self.value}
+        return data
 
     @classmethod
     def from_dict(cls, data: dict):
@@ -109,7 +152,7 @@ class SlashOptionChoice:
 
 
 class SlashOption:
-    __slots__ = ("type", "name", "description", "required", "choices", "options")
+    __slots__ = ("type", "name", "description", "required", "choices", "options", "_cached_dict")
 
     def __init__(
         self,
@@ -118,8 +161,8 @@ class SlashOption:
         name: str,
         description: str,
         required: bool = False,
-        choices: List[SlashOptionChoice] = [],
-        options: list = [],
+        choices: List[SlashOptionChoice] = None,
+        options: list = None,
     ):
         if not isinstance(option_type, SlashOptionType):
             option_type = SlashOptionType(option_type)
@@ -127,8 +170,9 @@ class SlashOption:
         self.name = name
         self.description = description
         self.required = required
-        self.choices = choices.copy()
-        self.options = options.copy()
+        self.choices = [] if choices is None else list(choices)
+        self.options = [] if options is None else list(options)
+        self._cached_dict = None
 
     def __str__(self):
         return self.name
@@ -142,7 +186,22 @@ class SlashOption:
         inner = " ".join(f"{value}={getattr(self, value)!r}" for value in values)
         return f"<SlashOption {inner}>"
 
+    def invalidate(self):
+        """
+        Clear the cached payloads of this option, its choices and its sub-options.
+
+        This must be called after modifying the option, since the payload is only built once.
+        """
+        self._cached_dict = None
+        for choice in self.choices:
+            choice.invalidate()
+        for option in self.options:
+            option.invalidate()
+
     def to_dict(self):
+        if (data := self._cached_dict) is not None:
+            return data
+
         data = {
             "type": self.type.value,
             "name": self.name,
@@ -154,22 +213,48 @@ class SlashOption:
             data["choices"] = [c.to_dict() for c in self.choices]
         if self.options:
             data["options"] = [o.to_dict() for o in self.options]
+        self._cached_dict = data
         return data
 
     @classmethod
     def from_dict(cls, data: dict):
-        choices = [SlashOptionChoice.from_dict(choice) for choice in data.get("choices", [])]
-
-        options = [cls.from_dict(option) for option in data.get("options", [])]
-        return cls(
-            option_type=SlashOptionType(data["type"]),
-            name=data["name"],
-            description=data["description"],
-            required=data.get("required", False),
-            choices=choices,
-            options=options,
+        choices = [SlashOptionChoice.from_dict(choice) for choice in data.get("choices") or _EMPTY]
+        options = [cls.from_dict(option) for option in data.get("options") or _EMPTY]
+        type_value = data["type"]
+        option_type = _OPTION_TYPES[type_value] if 0 <= type_value < len(_OPTION_TYPES) else None
+        if option_type is None:
+            option_type = SlashOptionType(type_value)
+        return cls._make(
+            option_type,
+            data["name"],
+            data["description"],
+            data.get("required", False),
+            choices,
+            options,
         )
 
+    @classmethod
+    def _make(
+        cls,
+        type: SlashOptionType,
+        name: str,
+        description: str,
+        required: bool,
+        choices: List[SlashOptionChoice],
+        options: List["SlashOption"],
+    ) -> "SlashOption":
+        # trusted constructor for from_dict, the type is already an enum member and the
+        # lists were just built so __init__'s validation and copies are skipped
+        self = object.__new__(cls)
+        self.type = type
+        self.name = name
+        self.description = description
+        self.required = required
+        self.choices = choices
+        self.options = options
+        self._cached_dict = None
+        return self
+
 
 class SlashCommand:
     __slots__ = (
@@ -181,6 +266,8 @@ class SlashCommand:
         "description",
         "guild_id",
         "options",
+        "_cached_dict",
+        "_cached_request",
     )
 
     def __init__(
@@ -192,7 +279,7 @@ class SlashCommand:
         name: str,
         description: str,
         guild_id: int = None,
-        options: List[SlashOption] = [],
+        options: List[SlashOption] = None,
     ):
         self.state = state
         self.http = state.http
@@ -202,7 +289,9 @@ class SlashCommand:
         self.name = name
         self.description = description
         self.guild_id = guild_id
-        self.options = options.copy()
+        self.options = [] if options is None else list(options)
+        self._cached_dict = None
+        self._cached_request = None
 
     def __str__(self) -> str:
         return self.name
@@ -216,59 +305,107 @@ class SlashCommand:
     def qualified_name(self) -> str:
         return self.name
 
+    def invalidate(self):
+        """
+        Clear the cached payloads returned by :meth:`to_request` and :meth:`to_dict`.
+
+        This must be called after modifying the command or its options, since the
+        payloads are only built once.
+        """
+        self._cached_dict = None
+        self._cached_request = None
+        for option in self.options:
+            option.invalidate()
+
     def to_request(self) -> dict:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "options": [o.to_dict() for o in self.options],
-        }
+        if (data := self._cached_request) is None:
+            data = self._cached_request = {
+                "name": self.name,
+                "description": self.description,
+                "options": [o.to_dict() for o in self.options],
+            }
+        return data
 
     def to_dict(self) -> dict:
-        return {
-            "id": self.id,
-            "application_id": self.application_id,
-            "name": self.name,
-            "description": self.description,
-            "options": [o.to_dict() for o in self.options],
-            "guild_id": self.guild_id,
-        }
+        if (data := self._cached_dict) is None:
+            request = self.to_request()
+            data = self._cached_dict = {
+                "id": self.id,
+                "application_id": self.application_id,
+                "name": request["name"],
+                "description": request["description"],
+                "options": request["options"],
+                "guild_id": self.guild_id,
+            }
+        # this ends up in Config, so hand out a copy of the dict and its options list.
+        # the option payloads themselves are shared with the cache and must not be mutated
+        data = data.copy()
+        data["options"] = list(data["options"])
+        return data
 
     @classmethod
     def from_dict(cls, state: "InteractionState", data: dict):
-        id = discord.utils._get_as_snowflake(data, "id")
-        application_id = discord.utils._get_as_snowflake(data, "application_id")
+        id = data.get("id")
+        application_id = data.get("application_id")
         name = data["name"]
         description = data["description"]
-        options = [SlashOption.from_dict(o) for o in data.get("options", [])]
-        guild_id = discord.utils._get_as_snowflake(data, "guild_id")
-        return cls(
+        options = [SlashOption.from_dict(o) for o in data.get("options") or _EMPTY]
+        guild_id = data.get("guild_id")
+        return cls._make(
             state,
-            id=id,
-            application_id=application_id,
-            name=name,
-            description=description,
-            guild_id=guild_id,
-            options=options,
+            int(id) if id is not None else None,
+            int(application_id) if application_id is not None else None,
+            name,
+            description,
+            int(guild_id) if guild_id is not None else None,
+            options,
         )
 
+    @classmethod
+    def _make(
+        cls,
+        state: "InteractionState",
+        id: Optional[int],
+        application_id: Optional[int],
+        name: str,
+        description: str,
+        guild_id: Optional[int],
+        options: List[SlashOption],
+    ) -> "SlashCommand":
+        # trusted constructor for from_dict, the options were just built so __init__'s
+        # copy is skipped
+        self = object.__new__(cls)
+        self.state = state
+        self.http = state.http
+        self.id = id
+        self.application_id = application_id
+        self.name = name
+        self.description = description
+        self.guild_id = guild_id
+        self.options = options
+        self._cached_dict = None
+        self._cached_request = None
+        return self
+
     async def save_config(self):
         async with self.state.config.commands() as commands:
             commands[self.id] = self.to_dict()
 
     def _parse_response_data(self, data: dict):
-        _id = discord.utils._get_as_snowflake(data, "id")
-        application_id = discord.utils._get_as_snowflake(data, "application_id")
+        _id = data.get("id")
+        application_id = data.get("application_id")
         name = data.get("name")
         description = data.get("description")
         if _id:
-            self.id = _id
+            self.id = int(_id)
         if application_id:
-            self.application_id = application_id
+            self.application_id = int(application_id)
         if name:
             self.name = name
         if description:
             self.description = description
-        self.options = [SlashOption.from_dict(o) for o in data.get("options", [])]
+        self.options = [SlashOption.from_dict(o) for o in data.get("options") or _EMPTY]
+        self.invalidate()
 
     async def register(self):
         if self.guild_id:
@@ -288,6 +425,9 @@ class SlashCommand:
         if description:
             payload["description"] = description
         if options:
+            # the options may have been modified since their payloads were cached
+            for option in options:
+                option.invalidate()
             payload["options"] = [o.to_dict() for o in options]
 
         if self.guild_id:
@@ -310,25 +450,21 @@ class SlashCommand:
                 pass
 
     def add_to_cache(self):
-        self.state.command_cache[self.id] = self
+        self.state._cache_command(self)
 
     def remove_from_cache(self):
-        try:
-            del self.state.command_cache[self.id]
-        except KeyError:
-            pass
+        self.state._uncache_command(self.id)
 
 
 class InteractionCommand(InteractionResponse):
-    __slots__ = ("command_name", "command_id", "options", "_cs_content")
+    __slots__ = ("command_name", "command_id", "options", "_cs_content", "_cs_command")
 
     def __init__(self, *, state: "InteractionState", data: dict):
         super().__init__(state=state, data=data)
         self.command_name = self.interaction_data["name"]
         self.command_id = int(self.interaction_data["id"])
-        self.options: List[ResponseOption] = []
-        self._parse_options(
-            self.interaction_data.get("options", []), self.interaction_data.get("resolved", {})
+        self.options: List[ResponseOption] = self._parse_options(
+            self.interaction_data.get("options", _EMPTY), self.interaction_data.get("resolved", {})
         )
 
     def __repr__(self) -> str:
@@ -336,82 +472,87 @@ class InteractionCommand(InteractionResponse):
 
     @discord.utils.cached_slot_property("_cs_content")
     def content(self):
-        items = [f"/{self.command_name}"]
-        for option in self.options:
-            items.append(f"`{option.name}: {option.value}`")
-        return " ".join(items)
+        if not self.options:
+            return f"/{self.command_name}"
+        # str.join builds a list from a generator anyway, so pass it one directly
+        options = " ".join([f"`{option.name}: {option.value}`" for option in self.options])
+        return f"/{self.command_name} {options}"
 
-    @property
+    @discord.utils.cached_slot_property("_cs_command")
     def command(self) -> Union[SlashCommand, UnknownCommand]:
-        return self.state.get_command(self.command_id) or UnknownCommand(id=self.command_id)
+        return self.state.get_command(self.command_id) or UnknownCommand.get(self.command_id)
 
     @property
     def jump_url(self):
         guild_id = getattr(self.guild, "id", "@me")
         return f"https://discord.com/channels/{guild_id}/{self.channel_id}/{self.id}"
 
-    def _parse_options(self, options: List[dict], resolved: Dict[str, Dict[str, dict]]):
-        for o in options:
-            option = ResponseOption.from_dict(o)
-            handler_name = f"_handle_option_{option.type.name.lower()}"
+    def _parse_options(
+        self, options: List[dict], resolved: Dict[str, Dict[str, dict]]
+    ) -> List[ResponseOption]:
+        parsed = [ResponseOption.from_dict(o) for o in options]
+        handlers = self._HANDLERS
+        for index, option in enumerate(parsed):
+            entry = handlers.get(option._type_value)
+            if entry is None:
+                continue
+            handler, resolved_key = entry
+            o = options[index]
+            # guard only the handler call, resolved data from Discord can still be malformed
             try:
-                handler = getattr(self, handler_name)
-            except AttributeError:
-                pass
-            else:
-                try:
-                    option = handler(o, option, resolved)
-                except Exception as error:
-                    log.exception(
-                        "Failed to handle option data for option:\n%r", o, exc_info=error
-                    )
-            self.options.append(option)
+                parsed[index] = handler(self, o, option, resolved[resolved_key])
+            except Exception as error:
+                log.exception("Failed to handle option data for option:\n%r", o, exc_info=error)
+        return parsed
 
     def _handle_option_channel(
-        self, data: dict, option: ResponseOption, resolved: Dict[str, Dict[str, dict]]
+        self, data: dict, option: ResponseOption, resolved_channels: Dict[str, dict]
     ):
-        channel_id = int(data["value"])
-        resolved_channel = resolved["channels"][data["value"]]
+        value = data["value"]
+        channel_id = int(value)
+        resolved_channel = resolved_channels[value]
         if self.guild_id:
             if channel := self.guild.get_channel(channel_id):
                 pass
             else:
                 channel = discord.TextChannel(
-                    state=self._discord_state, guild=self.guild, data=resolved_channel
+                    state=self.state._discord_state, guild=self.guild, data=resolved_channel
                 )
         else:
-            if channel := self._discord_state._get_private_channel(channel_id):
+            if channel := self.state._discord_state._get_private_channel(channel_id):
                 pass
             else:
                 channel = discord.DMChannel(
-                    state=self._discord_state, me=self.bot.user, data=resolved_channel
+                    state=self.state._discord_state, me=self.bot.user, data=resolved_channel
                 )
         option.set_value(channel)
         return option
 
     def _handle_option_user(
-        self, data: dict, option: ResponseOption, resolved: Dict[str, Dict[str, dict]]
+        self, data: dict, option: ResponseOption, resolved_users: Dict[str, dict]
     ):
-        user_id = int(data["value"])
-        resolved_user = resolved["users"][data["value"]]
+        value = data["value"]
+        user_id = int(value)
+        resolved_user = resolved_users[value]
         if self.guild_id:
             if user := self.guild.get_member(user_id):
                 pass
             else:
                 user = discord.Member(
-                    guild=self.guild, data=resolved_user, state=self._discord_state
+                    guild=self.guild, data=resolved_user, state=self.state._discord_state
                 )
                 self.guild._add_member(user)
         else:
-            user = self._discord_state.store_user(resolved_user)
+            user = self.state._discord_state.store_user(resolved_user)
         option.set_value(user)
         return option
 
     def _handle_option_role(
-        self, data: dict, option: ResponseOption, resolved: Dict[str, Dict[str, dict]]
+        self, data: dict, option: ResponseOption, resolved_roles: Dict[str, dict]
     ):
-        role_id = int(data["value"])
-        resolved_role = resolved["roles"][data["value"]]
+        value = data["value"]
+        role_id = int(value)
+        resolved_role = resolved_roles[value]
         if self.guild_id:
             if role := self.guild.get_role(role_id):
                 pass
@@ -421,6 +562,13 @@ class InteractionCommand(InteractionResponse):
             option.set_value(role)
         return option
 
+    # option type -> (handler, key of the resolved data it reads from)
+    _HANDLERS = {
+        SlashOptionType.CHANNEL.value: (_handle_option_channel, "channels"),
+        SlashOptionType.USER.value: (_handle_option_user, "users"),
+        SlashOptionType.ROLE.value: (_handle_option_role, "roles"),
+    }
+
     def to_reference(self, *args, **kwargs):
         # return None to prevent reply since interaction responses already reply (visually)
         # additionally, replying to an interaction response raises
@@ -1,3 +1,18 @@
+import os
+
 from setuptools import setup
 
-setup()
+ext_modules = []
+if os.environ.get("RED_INTERACTIONS_CYTHON") == "1":
+    # opt-in compiled build of the per-interaction option parsing, the pure Python
+    # module stays the fallback when this isn't set
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["red_interactions/models/slash_commands.py"],
+        # the annotations are hints, not checks. Cython would otherwise enforce them and
+        # reject values the pure Python module accepts, like int option values
+        compiler_directives={"language_level": "3", "annotation_typing": False},
+    )
+
+setup(ext_modules=ext_modules)